@@ -1,10 +1,42 @@
 import ctypes
 from ctypes import c_int, c_void_p, byref, create_string_buffer, addressof
+import functools
 import sys
+import threading
+
+# Upper bounds for the buffers filled by ConvertImageToAsset. The texture header
+# is 52 bytes; video data is at most 4 bytes per pixel once the surface is padded
+# out to the 360's 128x128 texture tiling.
+MAX_HEADER_SIZE = 256
+TILE_ALIGNMENT = 128
+# Output buffer for ConvertAssetToImage: 16 MB, enough for a 2048x2048 RGBA image
+MAX_IMAGE_SIZE = 2048 * 2048 * 4
+
+@functools.lru_cache(maxsize=None)
+def _ubyte_array(size):
+    """Return the (cached) ctypes c_ubyte array type of the given length"""
+    return ctypes.c_ubyte * size
+
+# Process-wide wrappers keyed by DLL path, see AuroraDLL.shared()
+_shared_instances = {}
+_shared_lock = threading.Lock()
+
+def _max_video_size(width, height):
+    # ConvertImageToAsset never treats *videoDataLen as a capacity: given a buffer it fills
+    # the whole tiled surface and only then writes the length back. Nothing checks for an
+    # overrun, so this bound (128-aligned, 4 bytes per pixel, a superset of the 360's
+    # 32x32 tiling) is what keeps the shared video buffer safe.
+    aligned_width = -(-width // TILE_ALIGNMENT) * TILE_ALIGNMENT
+    aligned_height = -(-height // TILE_ALIGNMENT) * TILE_ALIGNMENT
+    return aligned_width * aligned_height * 4
 
 class AuroraDLL:
     def __init__(self, dll_path=".\AuroraAsset.dll", verbose=False):
         self.verbose = verbose
+        self._header_buffer = _ubyte_array(MAX_HEADER_SIZE)()
+        self._video_buffer = None
+        self._image_buffer = None
+        self._lock = threading.Lock()
         try:
             if sys.platform.startswith("win"):
                 self.dll = ctypes.CDLL(dll_path)
@@ -18,10 +50,19 @@ class AuroraDLL:
             print(f"Failed to load DLL: {e}")
             raise
 
+    @classmethod
+    def shared(cls, dll_path=".\AuroraAsset.dll", verbose=False):
+        """Return the wrapper shared by the whole process for dll_path, loading it on first use"""
+        with _shared_lock:
+            instance = _shared_instances.get(dll_path)
+            if instance is None:
+                instance = _shared_instances[dll_path] = cls(dll_path, verbose=verbose)
+            return instance
+
     def _setup_functions(self):
         # ConvertImageToAsset
         self.dll.ConvertImageToAsset.argtypes = [
-            ctypes.POINTER(ctypes.c_ubyte),  # imageData
+            ctypes.c_char_p,                 # imageData (passed without copying)
             ctypes.c_int,                    # imageDataLen
             ctypes.c_int,                    # imageWidth
             ctypes.c_int,                    # imageHeight
@@ -61,35 +102,33 @@ class AuroraDLL:
         if self.verbose:
             print("  Processing image to asset...")
         try:
-            # Convert Python bytes to ctypes array
-            image_data_ptr = (ctypes.c_ubyte * len(image_data)).from_buffer_copy(image_data)
-            
-            # Prepare output buffers
+            # Bytes are handed to the DLL as a pointer to their own buffer, no copy needed
+            image_data_ptr = image_data if isinstance(image_data, bytes) else bytes(image_data)
+
             header_data_len = ctypes.c_int()
             video_data_len = ctypes.c_int()
-            
-            # First call to get buffer sizes
-            result = self.dll.ConvertImageToAsset(
-                image_data_ptr, len(image_data), width, height, int(compression),
-                None, ctypes.byref(header_data_len), None, ctypes.byref(video_data_len)
-            )
-            
-            if result == 1:
-                # Allocate buffers
-                header_data = (ctypes.c_ubyte * header_data_len.value)()
-                video_data = (ctypes.c_ubyte * video_data_len.value)()
-                
-                # Second call to get actual data
+
+            # The output buffers are shared between calls; the video buffer only ever grows.
+            # The lock also keeps DLL calls one at a time, as the DLL is not known to be reentrant
+            with self._lock:
+                header_data = self._header_buffer
+                video_capacity = _max_video_size(width, height)
+                if self._video_buffer is None or len(self._video_buffer) < video_capacity:
+                    self._video_buffer = _ubyte_array(video_capacity)()
+                video_data = self._video_buffer
+
+                # Buffers are sized for the largest possible result, so no size query is needed
                 result = self.dll.ConvertImageToAsset(
                     image_data_ptr, len(image_data), width, height, int(compression),
                     header_data, ctypes.byref(header_data_len),
                     video_data, ctypes.byref(video_data_len)
                 )
-                
+
                 if result == 1:
                     if self.verbose:
                         print("  Image processing successful")
-                    return True, bytes(header_data), bytes(video_data)
+                    return (True, ctypes.string_at(addressof(header_data), header_data_len.value),
+                            ctypes.string_at(addressof(video_data), video_data_len.value))
         except Exception as e:
             print(f"Error in process_image_to_asset: {e}")
         return False, None, None
@@ -97,25 +136,31 @@ class AuroraDLL:
     def process_asset_to_image(self, texture_header, video_data):
         try:
             # Convert texture_header and video_data to ctypes arrays
-            texture_header = (ctypes.c_ubyte * len(texture_header))(*texture_header)
-            video_data = (ctypes.c_ubyte * len(video_data))(*video_data)
+            texture_header = _ubyte_array(len(texture_header)).from_buffer_copy(texture_header)
+            video_data = _ubyte_array(len(video_data)).from_buffer_copy(video_data)
             
             # Prepare output buffers
-            image_data = (ctypes.c_ubyte * (1024 * 1024 * 4))()  # Max 1MB image buffer
             image_data_len = ctypes.c_int()
             width = ctypes.c_int()
             height = ctypes.c_int()
-            
-            # Call the DLL function
-            result = self.dll.ConvertAssetToImage(
-                texture_header, len(texture_header),
-                video_data, len(video_data),
-                image_data, ctypes.byref(image_data_len),
-                ctypes.byref(width), ctypes.byref(height)
-            )
-            
-            if result == 1:
-                return True, bytes(image_data[:image_data_len.value]), width.value, height.value
+
+            # The output buffer is allocated once and shared between calls
+            with self._lock:
+                if self._image_buffer is None:
+                    self._image_buffer = _ubyte_array(MAX_IMAGE_SIZE)()
+                image_data = self._image_buffer
+
+                # Call the DLL function
+                result = self.dll.ConvertAssetToImage(
+                    texture_header, len(texture_header),
+                    video_data, len(video_data),
+                    image_data, ctypes.byref(image_data_len),
+                    ctypes.byref(width), ctypes.byref(height)
+                )
+
+                if result == 1:
+                    image = ctypes.string_at(addressof(image_data), image_data_len.value)
+                    return True, image, width.value, height.value
             return False, None, 0, 0
         except Exception as e:
             print(f"Error in process_asset_to_image: {e}")
@@ -154,7 +199,7 @@ class AuroraDLL:
             if result != 1:
                 return False, None, 0, 0
 
-            return True, image_buffer.raw, width.value, height.value
+            return True, ctypes.string_at(addressof(image_buffer), image_len.value), width.value, height.value
 
         except Exception as e:
             print(f"Error in process_dds_to_image: {str(e)}")
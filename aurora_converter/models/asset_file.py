@@ -1,13 +1,18 @@
+import mmap
+import os
 from PIL import Image
 import struct
 from typing import Optional
 from aurora_converter.utils.exceptions import AssetError, AssetFileError
 
+_HEADER = struct.Struct('>5I')  # Magic, Version, DataSize, Flags, ScreenshotCount
+_ENTRY_RECORD = struct.Struct('>3I52s')  # Offset, Size, ExtendedInfo, TextureHeader
+
 class AuroraAssetFile:
     def __init__(self, dll_path=".\AuroraAsset.dll", verbose=False):
         self.verbose = verbose
         try:
-            self.converter = AuroraDLL(dll_path, verbose=self.verbose)
+            self.converter = AuroraDLL.shared(dll_path, verbose=self.verbose)
             if self.verbose:
                 print("AuroraAssetFile initialized successfully")
         except Exception as e:
@@ -24,27 +29,26 @@ class AuroraAssetFile:
         self.ALIGNMENT = 2048
         self.HEADER_SIZE = 20
         self.ENTRY_SIZE = 64
-        self.entries = [{'offset': 0, 'size': 0, 'texture_header': bytearray(52), 'video_data': bytearray()} 
-                       for _ in range(AssetType.Max + 1)]
+        self.entry_table = bytearray((AssetType.Max + 1) * self.ENTRY_SIZE)  # Packed in place on import
+        self.video_data = [b''] * (AssetType.Max + 1)
+        self.data_offset = self._calculate_data_offset()
 
     def import_image(self, image_path: str, asset_type: AssetType = AssetType.Background, compression: bool = True, verbose: bool = False) -> bool:
         try:
             if verbose:
                 print(f"\nImporting {asset_type.name} from: {image_path}")
             with Image.open(image_path) as img:
+                width, height = img.size
                 if verbose:
-                    print(f"  Image size: {img.width}x{img.height}")
+                    print(f"  Image size: {width}x{height}")
                 img = img.convert('RGBA')
-                raw_bytes = bytearray()
-                for y in range(img.height):
-                    for x in range(img.width):
-                        r, g, b, a = img.getpixel((x, y))
-                        raw_bytes.extend([a, r, g, b])
+                r, g, b, a = img.split()
+                raw_bytes = Image.merge('RGBA', (a, r, g, b)).tobytes()
 
             if verbose:
                 print("  Converting image to asset format...")
             success, header, video = self.converter.process_image_to_asset(
-                bytes(raw_bytes), img.width, img.height, compression
+                raw_bytes, width, height, compression
             )
             
             if success:
@@ -80,12 +84,8 @@ class AuroraAssetFile:
                              f"(Entry {entry_idx}, Flag {hex(self.flags)})")
 
                 # Clear the target entry before writing new data
-                self.entries[entry_idx] = {
-                    'offset': 0,
-                    'size': len(video),
-                    'texture_header': bytearray(header),
-                    'video_data': bytearray(video)
-                }
+                _ENTRY_RECORD.pack_into(self.entry_table, entry_idx * self.ENTRY_SIZE, 0, len(video), 0, header)
+                self.video_data[entry_idx] = video
                 if verbose:
                     print(f"  Stored data in entry {entry_idx} (Size: {len(video)} bytes)")
                 
@@ -103,47 +103,35 @@ class AuroraAssetFile:
                 print(f"  Flags: {hex(self.flags)}")
                 print(f"  Screenshot Count: {self.screenshot_count}")
             
-            with open(output_path, 'wb') as f:
-                # Write header
-                f.write(struct.pack('<I', self._swap_uint32(self.MAGIC)))  # Magic
-                f.write(struct.pack('<I', self._swap_uint32(self.VERSION)))  # Version
-                f.write(struct.pack('<I', self._swap_uint32(0)))  # DataSize (will be updated later)
-                f.write(struct.pack('<I', self._swap_uint32(self.flags)))  # Flags
-                f.write(struct.pack('<I', self._swap_uint32(self.screenshot_count)))  # ScreenshotCount
+            # Build the header followed by the entry table
+            data_size = sum(map(len, self.video_data))
+            table = bytearray(_HEADER.pack(self.MAGIC, self.VERSION, data_size, self.flags, self.screenshot_count))
 
             if verbose:
                 print("\nWriting entry table:")
-            # Write entry table
-            for idx, entry in enumerate(self.entries):
-                if entry['size'] > 0 and verbose:
-                    print(f"  Entry {idx}: Size={entry['size']} bytes")
-                f.write(struct.pack('<I', self._swap_uint32(entry['offset'])))  # Offset
-                f.write(struct.pack('<I', self._swap_uint32(entry['size'])))  # Size
-                f.write(struct.pack('<I', self._swap_uint32(0)))  # ExtendedInfo
-                f.write(entry['texture_header'])  # TextureHeader (52 bytes)
-
-            # Calculate data size and update header
-            data_size = sum(len(entry['video_data']) for entry in self.entries)
-            f.seek(8)  # Go back to DataSize position
-            f.write(struct.pack('<I', self._swap_uint32(data_size)))
+                for idx, video in enumerate(self.video_data):
+                    if video:
+                        print(f"  Entry {idx}: Size={len(video)} bytes")
+            table += self.entry_table
             if verbose:
                 print(f"\nTotal data size: {data_size} bytes")
 
             # Write padding to align to 2048 bytes
-            current_pos = f.tell()
-            padding_size = (self.ALIGNMENT - (current_pos % self.ALIGNMENT)) % self.ALIGNMENT
+            padding_size = self.data_offset - len(table)
             if verbose and padding_size > 0:
                 print(f"  Adding {padding_size} bytes padding for alignment")
-            f.write(bytearray(padding_size))
 
             if verbose:
                 print("\nWriting video data:")
-            # Write video data
-            for idx, entry in enumerate(self.entries):
-                if entry['video_data'] and verbose:
-                    print(f"  Writing {len(entry['video_data'])} bytes for entry {idx}")
-                if entry['video_data']:
-                    f.write(entry['video_data'])
+                for idx, video in enumerate(self.video_data):
+                    if video:
+                        print(f"  Writing {len(video)} bytes for entry {idx}")
+
+            with open(output_path, 'wb') as f:
+                f.write(table)
+                f.truncate(self.data_offset)  # Zero-filled by the OS
+                f.seek(self.data_offset)
+                f.writelines(video for video in self.video_data if video)
 
             if verbose:
                 print("\nAsset saved successfully!")
@@ -155,50 +143,37 @@ class AuroraAssetFile:
     def extract_image(self, asset_path: str, asset_type: AssetType) -> Optional[Image.Image]:
         try:
             with open(asset_path, 'rb') as f:
-                data = f.read()
+                if os.fstat(f.fileno()).st_size < self.ALIGNMENT:
+                    raise AssetFileError("Invalid asset file size")
 
-            if len(data) < self.ALIGNMENT:
-                raise AssetFileError("Invalid asset file size")
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    # Validate header
+                    magic, version = _HEADER.unpack_from(data, 0)[:2]
 
-            # Validate header
-            magic = self._swap_uint32(struct.unpack('<I', data[0:4])[0])
-            version = self._swap_uint32(struct.unpack('<I', data[4:8])[0])
-            
-            if magic != self.MAGIC:
-                raise AssetFileError("Invalid asset file magic")
-            if version != self.VERSION:
-                raise AssetFileError("Unsupported asset file version")
-
-            # Read entry table
-            entry_offset = self.HEADER_SIZE + (asset_type.value * self.ENTRY_SIZE)
-            offset = self._swap_uint32(struct.unpack('<I', data[entry_offset:entry_offset+4])[0])
-            size = self._swap_uint32(struct.unpack('<I', data[entry_offset+4:entry_offset+8])[0])
-            
-            if size == 0:
-                return None
+                    if magic != self.MAGIC:
+                        raise AssetFileError("Invalid asset file magic")
+                    if version != self.VERSION:
+                        raise AssetFileError("Unsupported asset file version")
 
-            texture_header = data[entry_offset+12:entry_offset+64]
-            data_offset = self._calculate_data_offset() + offset
-            video_data = data[data_offset:data_offset+size]
+                    # Read entry table
+                    entry_offset = self.HEADER_SIZE + (asset_type.value * self.ENTRY_SIZE)
+                    offset, size, _, texture_header = _ENTRY_RECORD.unpack_from(data, entry_offset)
 
-            success, image_data, width, height = self.converter.process_asset_to_image(
-                texture_header, video_data
-            )
+                    if size == 0:
+                        return None
+
+                    data_offset = self.data_offset + offset
+                    with memoryview(data)[data_offset:data_offset+size] as video_data:
+                        success, image_data, width, height = self.converter.process_asset_to_image(
+                            texture_header, video_data
+                        )
 
             if success:
-                img_array = bytearray(image_data)
-                for i in range(0, len(img_array), 4):
-                    img_array[i], img_array[i+1], img_array[i+2], img_array[i+3] = \
-                        img_array[i+3], img_array[i+2], img_array[i+1], img_array[i]
-                
-                return Image.frombytes('RGBA', (width, height), bytes(img_array))
+                return Image.frombytes('RGBA', (width, height), image_data, 'raw', 'ABGR')
             return None
         except Exception as e:
             raise AssetError(f"Error extracting image: {e}") from e
 
-    def _swap_uint32(self, value: int) -> int:
-        return struct.unpack(">I", struct.pack("<I", value))[0]
-
     def _calculate_data_offset(self) -> int:
-        offset = self.HEADER_SIZE + (len(self.entries) * self.ENTRY_SIZE)
-        return offset + (self.ALIGNMENT - (offset % self.ALIGNMENT)) 
\ No newline at end of file
+        offset = self.HEADER_SIZE + len(self.entry_table)
+        return offset + (self.ALIGNMENT - (offset % self.ALIGNMENT)) % self.ALIGNMENT 
\ No newline at end of file
@@ -1,15 +1,16 @@
 import os
 
+# Asset file name prefixes, see ensure_prefix()
+_ASSET_PREFIXES = frozenset(('BK', 'GC', 'GL', 'SS'))
+
 def ensure_prefix(output_path: str, asset_type: AssetType) -> str:
     """Ensure the output file has the correct prefix for its type."""
     dir_name = os.path.dirname(output_path)
     base_name = os.path.basename(output_path)
     
     # Remove any existing asset prefix
-    for prefix in ['BK', 'GC', 'GL', 'SS']:
-        if base_name.startswith(prefix):
-            base_name = base_name[2:]
-            break
+    if base_name[:2] in _ASSET_PREFIXES:
+        base_name = base_name[2:]
     
     return os.path.join(dir_name, f"{asset_type.prefix}{base_name}")
 
@@ -1,5 +1,8 @@
 import struct
 import os
+import io
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from enum import IntEnum
 import argparse
@@ -10,6 +13,10 @@ from typing import Dict, List, Tuple, Optional
 
 init()
 
+_MAGIC = struct.Struct('>I')
+_FLAGS = struct.Struct('>II')  # Flags, screenshot count (header offset 12)
+_ENTRY = struct.Struct('>4x I 40x 4s 12x')  # Size and metadata of a 64 byte entry
+
 class AssetType(IntEnum):
     Icon = 0
     Banner = 1
@@ -29,6 +36,7 @@ class AssetScanner:
     MAGIC = 0x52584541
     HEADER_SIZE, ENTRY_SIZE, ALIGNMENT = 20, 64, 2048
     SIZE_TOLERANCE = 0.01
+    PARALLEL_MIN_FOLDERS = 200  # Below this, starting worker processes costs more than it saves
     SIZE_THRESHOLDS = {
         'BK': 983040, 'GC': 655360, 
         'GL': 83968, 'SS': 3276800
@@ -48,14 +56,18 @@ class AssetScanner:
 
     def __init__(self, verbose=False, very_verbose=False):
         self.verbose, self.vv = verbose, very_verbose
+        self._log_records = None  # Collects log records instead of logging them, see _scan_folder_worker
+        # Metadata bytes expected at each (prefix, entry index), inverted from the tables above
+        pattern_bytes = {name: pattern for pattern, name in self.ASSET_PATTERNS.items()}
+        expected_types = {**self.EXPECTED_TYPES, **{('SS', idx): 'Screenshot' for idx in range(5, 10)}}
+        self._expected_meta = {key: pattern_bytes[name] for key, name in expected_types.items()}
         logging.basicConfig(filename='scanner.log', filemode='w',
                           format='%(asctime)s - %(levelname)s - %(message)s',
                           level=logging.DEBUG)
 
-    def _swap32(self, val: int) -> int: return struct.unpack(">I", struct.pack("<I", val))[0]
-
     def _log(self, msg: str, status: Optional[str]=None, folder: str=None):
-        logging.error(msg) if status == 'FAIL' else logging.info(msg)
+        record = (logging.ERROR if status == 'FAIL' else logging.INFO, msg)
+        self._log_records.append(record) if self._log_records is not None else logging.log(*record)
         if not self.verbose: return
 
         timestamp = datetime.now().strftime('%H:%M:%S')
@@ -69,9 +81,7 @@ class AssetScanner:
 
     def _validate_metadata(self, prefix: str, idx: int, meta: bytes) -> bool:
         if self.vv: print(f"  Checking {prefix}{idx}: {' '.join(f'{b:02x}' for b in meta)}")
-        expected = self.EXPECTED_TYPES.get((prefix, idx), 
-                  'Screenshot' if prefix == 'SS' and 5 <= idx <= 9 else None)
-        return self.ASSET_PATTERNS.get(meta, '') == expected
+        return meta == self._expected_meta.get((prefix, idx))
 
     def _validate_size(self, size: int, prefix: str) -> bool:
         target = self.SIZE_THRESHOLDS[('GL' if prefix == 'GL' else prefix)]
@@ -81,65 +91,89 @@ class AssetScanner:
         issues = []
         try:
             with path.open('rb') as f:
-                if self._swap32(struct.unpack('<I', f.read(4))[0]) != self.MAGIC:
+                file_size = os.fstat(f.fileno()).st_size
+                header = f.read(self.HEADER_SIZE)
+                if _MAGIC.unpack_from(header)[0] != self.MAGIC:
                     return False, ["Invalid magic"]
                 
-                f.seek(12)
-                flags, ss_count = map(self._swap32, struct.unpack('<II', f.read(8)))
+                flags, ss_count = _FLAGS.unpack_from(header, 12)
                 prefix = path.name[:2]
+
+                # Read the whole entry table at once and unpack the complete entries from it
+                table = f.read(self.ENTRY_SIZE * (AssetType.Max + 1))
+                table = table[:len(table) - len(table) % self.ENTRY_SIZE]
                 entry_count = 0
 
-                for idx in range(AssetType.Max + 1):
-                    entry = f.read(self.ENTRY_SIZE)
-                    if len(entry) < self.ENTRY_SIZE: break
-                    size = self._swap32(struct.unpack('<I', entry[4:8])[0])
-                    
+                for idx, (size, meta) in enumerate(_ENTRY.iter_unpack(table)):
                     if size > 0:
                         entry_count += 1
-                        meta = entry[48:52]
                         if not self._validate_metadata(prefix, idx, meta):
                             issues.append(f"Invalid metadata at {idx}: {meta.hex()}")
                 
                 if entry_count != self.EXPECTED_ENTRIES[prefix]:
                     issues.append(f"Expected {self.EXPECTED_ENTRIES[prefix]} entries, found {entry_count}")
                 
-                if not self._validate_size(path.stat().st_size, prefix):
+                if not self._validate_size(file_size, prefix):
                     issues.append(f"Size mismatch for {prefix}")
                 
         except Exception as e: issues.append(f"Read error: {str(e)}")
         return len(issues) == 0, issues
 
     def scan_folder(self, path: Path) -> bool:
-        self._log(f"Scanning {path.name}", folder=path.name)
+        folder = path.name
+        self._log(f"Scanning {folder}", folder=folder)
         print(f"{'-'*75}")
-        assets = list(path.rglob("*.asset"))
+        # Walk once with plain strings, building Path objects only for the asset files;
+        # the extension is matched case-insensitively as rglob does on Windows
+        assets = [(name, Path(dirpath, name)) for dirpath, _, names in os.walk(path)
+                  for name in names if name.lower().endswith('.asset')]
         if len(assets) != 4: 
-            self._log(f"Invalid asset count: found {len(assets)}, expected 4", 'FAIL', path.name)
+            self._log(f"Invalid asset count: found {len(assets)}, expected 4", 'FAIL', folder)
             return False
 
-        basenames = {a.name[2:] for a in assets}
+        basenames = {name[2:] for name, _ in assets}
         if len(basenames) > 1:
-            self._log(f"Name mismatch: {', '.join(basenames)}", 'FAIL', path.name)
+            self._log(f"Name mismatch: {', '.join(basenames)}", 'FAIL', folder)
             return False
 
         valid = True
-        for asset in assets:
+        for name, asset in assets:
             ok, issues = self.scan_asset(asset)
             status = 'OK' if ok else 'FAIL'
-            self._log(f"{asset.name}: {status}", status, path.name)
+            self._log(f"{name}: {status}", status, folder)
             valid &= ok
-            for issue in issues: self._log(issue, 'FAIL', path.name)
+            for issue in issues: self._log(issue, 'FAIL', folder)
         
         print("")
         return valid
 
+    def _scan_folder_worker(self, path: Path) -> Tuple[bool, str, List[Tuple[int, str]]]:
+        """Scan a folder in a worker process, returning the result with its console output and log records"""
+        self._log_records = []
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            valid = self.scan_folder(path)
+        return valid, output.getvalue(), self._log_records
+
     def scan_root(self, root: Path):
 
         if not root.exists(): return self._log("Invalid path", 'FAIL')
         
         folders = [f for f in root.iterdir() if f.is_dir()]
         total = len(folders)
-        valid = sum(self.scan_folder(f) for f in folders)
+        workers = os.cpu_count() or 1
+        if workers > 1 and total >= self.PARALLEL_MIN_FOLDERS:
+            valid = 0
+            # Folders are scanned in parallel, in batches to keep IPC per folder low;
+            # output and logging are replayed here in folder order
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(self._scan_folder_worker, folders,
+                                       chunksize=max(1, total // (4 * workers)))
+                for folder_valid, output, records in results:
+                    print(output, end='')
+                    for level, msg in records: logging.log(level, msg)
+                    valid += folder_valid
+        else:
+            valid = sum(self.scan_folder(f) for f in folders)
 
         print(f"{'-'*75}\nCompleted scan: {Style.BRIGHT}{valid}/{total} valid.\n")
 